@@ -9,6 +9,7 @@ import re
 from collections import defaultdict
 from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal, NamedTuple, TypeVar
 
 from cmk.plugins.kube.api_server import APIData
@@ -30,14 +31,19 @@ AnnotationOption = (
 class PodOwner:
     pods: Sequence[api.Pod]
 
+    @cached_property
+    def _containers(self) -> Sequence[api.ContainerSpec]:
+        # Flattened once per instance, since both resource aggregations need it.
+        return [c for pod in self.pods for c in pod.spec.containers]
+
     def pod_resources(self) -> section.PodResources:
         return pod_resources_from_api_pods(self.pods)
 
     def memory_resources(self) -> section.Resources:
-        return collect_memory_resources_from_api_pods(self.pods)
+        return aggregate_resources("memory", self._containers)
 
     def cpu_resources(self) -> section.Resources:
-        return collect_cpu_resources_from_api_pods(self.pods)
+        return aggregate_resources("cpu", self._containers)
 
 
 @dataclass(frozen=True)
@@ -126,16 +132,13 @@ def kube_object_namespace_name(kube_object: KubeNamespacedObj) -> NamespaceName:
 def aggregate_resources(
     resource_type: Literal["memory", "cpu"], containers: Collection[api.ContainerSpec]
 ) -> section.Resources:
-    specified_requests = [
-        request
-        for c in containers
-        if (request := getattr(c.resources.requests, resource_type)) is not None
-    ]
-    specified_limits = [
-        limit
-        for c in containers
-        if (limit := getattr(c.resources.limits, resource_type)) is not None
-    ]
+    specified_requests = []
+    specified_limits = []
+    for c in containers:
+        if (request := getattr(c.resources.requests, resource_type)) is not None:
+            specified_requests.append(request)
+        if (limit := getattr(c.resources.limits, resource_type)) is not None:
+            specified_limits.append(limit)
 
     count_total = len(containers)
 
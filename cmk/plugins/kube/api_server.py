@@ -3,12 +3,12 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import concurrent.futures
 import contextlib
 import itertools
 import json
 import logging
 import re
-import time
 import typing
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
@@ -40,12 +40,17 @@ from cmk.plugins.kube.transform_json import (
 )
 
 LOGGER = logging.getLogger()
+# The kubelet endpoints are queried once per node. The queries are independent of each
+# other, so they are dispatched through a thread pool instead of one round trip per node.
+KUBELET_QUERY_WORKERS = 16
 VERSION_MATCH_RE = re.compile(r"\s*v?([0-9]+(?:\.[0-9]+)*).*")
 SUPPORTED_VERSIONS = [(1, 24), (1, 25), (1, 26), (1, 27), (1, 28), (1, 29), (1, 30)]
 # PM decision: LOWEST_FUNCTIONING_VERSION is incremented, if an issue is reported by a customer.
 # Otherwise, we try not change anything in monitoring (despite lack of support).
 LOWEST_FUNCTIONING_VERSION = (1, 21)
 SUPPORTED_VERSIONS_DISPLAY = ", ".join(f"v{major}.{minor}" for major, minor in SUPPORTED_VERSIONS)
+# Constructing a TypeAdapter is expensive, so share one instance across runs.
+_PERSISTENT_VOLUMES_ADAPTER = pydantic.TypeAdapter(list[api.PersistentVolume])
 
 
 class FakeResponse:
@@ -160,19 +165,22 @@ class CoreAPI(RawAPI):
         return send_request(self._config, self._client, request).text
 
     def query_kubelet_metrics(self, node_names: Sequence[str]) -> Sequence[str]:
-        result = []
-        finish_time = time.time() + 30.0
-        node_queue = list(node_names)
-        while time.time() < finish_time and node_queue:
-            node_name = node_queue.pop()
+        def query_node(node_name: str) -> str | None:
             request = requests.Request(
                 "GET", self._config.url(f"/api/v1/nodes/{node_name}/proxy/metrics")
             )
             with contextlib.suppress(requests.RequestException):
                 response = send_request(self._config, self._client, request)
                 response.raise_for_status()
-                result.append(response.text)
-        return result
+                return response.text
+            return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=KUBELET_QUERY_WORKERS) as executor:
+            futures = [executor.submit(query_node, node_name) for node_name in node_names]
+            done, not_done = concurrent.futures.wait(futures, timeout=30.0)
+            for future in not_done:
+                future.cancel()
+            return [text for future in futures if future in done and (text := future.result())]
 
     def query_raw_nodes(self) -> JSONNodeList:
         request = requests.Request("GET", self._config.url("/api/v1/nodes"))
@@ -185,15 +193,14 @@ class CoreAPI(RawAPI):
     def query_kubelet_health(
         self, node_names: Sequence[str]
     ) -> Mapping[str, api.HealthZ | api.NodeConnectionError]:
-        node_to_health: dict[str, api.HealthZ | api.NodeConnectionError] = {}
-        for node_name in node_names:
+        def query_node(node_name: str) -> api.HealthZ | api.NodeConnectionError:
             try:
-                node_to_health[node_name] = self._get_healthz(
-                    f"/api/v1/nodes/{node_name}/proxy/healthz"
-                )
+                return self._get_healthz(f"/api/v1/nodes/{node_name}/proxy/healthz")
             except requests.RequestException as e:
-                node_to_health[node_name] = api.NodeConnectionError(message=str(e))
-        return node_to_health
+                return api.NodeConnectionError(message=str(e))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=KUBELET_QUERY_WORKERS) as executor:
+            return dict(zip(node_names, executor.map(query_node, node_names)))
 
     def _get_healthz(self, resource_path: str) -> api.HealthZ:
         request = requests.Request("GET", self._config.url(resource_path))
@@ -335,7 +342,7 @@ def _verify_version_support(version: api.KubernetesVersion | api.UnknownKubernet
     LOGGER.warning(msg="Processing data is done on a best effort basis.")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class APIData:
     cron_jobs: Sequence[api.CronJob]
     deployments: Sequence[api.Deployment]
@@ -352,7 +359,7 @@ class APIData:
     cluster_details: api.ClusterDetails
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnparsedAPIData:
     raw_jobs: Sequence[client.V1Job]
     raw_cron_jobs: Sequence[client.V1CronJob]
@@ -381,25 +388,43 @@ def query_raw_api_data_v2(
 ) -> UnparsedAPIData:
     raw_nodes = core_api.query_raw_nodes()
     node_names = [raw_node["metadata"]["name"] for raw_node in raw_nodes["items"]]
-    return UnparsedAPIData(
-        raw_jobs=client_batch_api.query_raw_jobs(),
-        raw_cron_jobs=client_batch_api.query_raw_cron_jobs(),
-        raw_pods=client_core_api.query_raw_pods(),
-        raw_nodes=raw_nodes,
-        raw_namespaces=client_core_api.query_raw_namespaces(),
-        raw_resource_quotas=client_core_api.query_raw_resource_quotas(),
-        raw_persistent_volume_claims=client_core_api.query_persistent_volume_claims(),
-        raw_persistent_volumes=client_core_api.query_persistent_volumes(),
-        raw_deployments=client_apps_api.query_raw_deployments(),
-        raw_daemonsets=client_apps_api.query_raw_daemon_sets(),
-        raw_statefulsets=apps_api.query_raw_statefulsets(),
-        raw_replica_sets=client_apps_api.query_raw_replica_sets(),
-        node_to_kubelet_health=core_api.query_kubelet_health(node_names),
-        api_health=core_api.query_api_health(),
-        raw_kubelet_open_metrics_dumps=(
-            core_api.query_kubelet_metrics(node_names) if query_kubelet_endpoints else []
-        ),
-    )
+    # The list queries below are independent of each other, so they are submitted to a
+    # thread pool upfront and only collected when assembling the result.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        raw_jobs = executor.submit(client_batch_api.query_raw_jobs)
+        raw_cron_jobs = executor.submit(client_batch_api.query_raw_cron_jobs)
+        raw_pods = executor.submit(client_core_api.query_raw_pods)
+        raw_namespaces = executor.submit(client_core_api.query_raw_namespaces)
+        raw_resource_quotas = executor.submit(client_core_api.query_raw_resource_quotas)
+        raw_persistent_volume_claims = executor.submit(
+            client_core_api.query_persistent_volume_claims
+        )
+        raw_persistent_volumes = executor.submit(client_core_api.query_persistent_volumes)
+        raw_deployments = executor.submit(client_apps_api.query_raw_deployments)
+        raw_daemonsets = executor.submit(client_apps_api.query_raw_daemon_sets)
+        raw_statefulsets = executor.submit(apps_api.query_raw_statefulsets)
+        raw_replica_sets = executor.submit(client_apps_api.query_raw_replica_sets)
+        api_health = executor.submit(core_api.query_api_health)
+        node_to_kubelet_health = executor.submit(core_api.query_kubelet_health, node_names)
+        return UnparsedAPIData(
+            raw_jobs=raw_jobs.result(),
+            raw_cron_jobs=raw_cron_jobs.result(),
+            raw_pods=raw_pods.result(),
+            raw_nodes=raw_nodes,
+            raw_namespaces=raw_namespaces.result(),
+            raw_resource_quotas=raw_resource_quotas.result(),
+            raw_persistent_volume_claims=raw_persistent_volume_claims.result(),
+            raw_persistent_volumes=raw_persistent_volumes.result(),
+            raw_deployments=raw_deployments.result(),
+            raw_daemonsets=raw_daemonsets.result(),
+            raw_statefulsets=raw_statefulsets.result(),
+            raw_replica_sets=raw_replica_sets.result(),
+            node_to_kubelet_health=node_to_kubelet_health.result(),
+            api_health=api_health.result(),
+            raw_kubelet_open_metrics_dumps=(
+                core_api.query_kubelet_metrics(node_names) if query_kubelet_endpoints else []
+            ),
+        )
 
 
 def parse_api_data(
@@ -476,13 +501,6 @@ def parse_api_data(
 
     cluster_details = api.ClusterDetails(api_health=api_health, version=git_version)
 
-    def _parse_obj_as(
-        model: type[list[api.PersistentVolume]],
-        expr: typing.Sequence[typing.Any],
-    ) -> typing.Sequence[api.PersistentVolume]:
-        adapter = pydantic.TypeAdapter(model)
-        return adapter.validate_python(expr)
-
     return APIData(
         cron_jobs=cron_jobs,
         deployments=deployments,
@@ -493,7 +511,7 @@ def parse_api_data(
         nodes=nodes,
         pods=pods,
         persistent_volume_claims=persistent_volume_claims,
-        persistent_volumes=_parse_obj_as(list[api.PersistentVolume], raw_persistent_volumes),
+        persistent_volumes=_PERSISTENT_VOLUMES_ADAPTER.validate_python(raw_persistent_volumes),
         kubelet_open_metrics=[
             kubelet_metric_sample
             for dump in kubelet_open_metrics_dumps
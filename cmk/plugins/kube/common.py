@@ -7,8 +7,8 @@ Module for definitions and functions which are used by both the special_agent/ag
 the utils_kubernetes/performance
 """
 
-import itertools
 import logging
+from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Generic, NewType, TypeVar
@@ -25,13 +25,13 @@ PodLookupName = NewType("PodLookupName", str)
 SectionName = NewType("SectionName", str)
 
 
-@dataclass
+@dataclass(slots=True)
 class Piggyback:
     piggyback: str
     pod_names: Sequence[PodLookupName]
 
 
-@dataclass
+@dataclass(slots=True)
 class PodsToHost:
     piggybacks: Sequence[Piggyback]
     namespace_piggies: Sequence[Piggyback]
@@ -59,7 +59,7 @@ class IdentifiableSample(BaseModel):
         return lookup_name(self.namespace, self.pod_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WriteableSection:
     piggyback_name: str
     section_name: SectionName
@@ -67,15 +67,16 @@ class WriteableSection:
 
 
 def write_sections(items: Iterable[WriteableSection]) -> None:
-    def key_function(item: WriteableSection) -> str:
-        return item.piggyback_name
-
-    # Optimize for size of agent output
-    for key, group in itertools.groupby(sorted(items, key=key_function), key_function):
-        with ConditionalPiggybackSection(key):
+    # Group by piggyback host to optimize for size of agent output. A single hash-map
+    # pass is enough for that, no need to sort the whole section list first.
+    grouped: defaultdict[str, list[WriteableSection]] = defaultdict(list)
+    for item in items:
+        grouped[item.piggyback_name].append(item)
+    for piggyback_name, group in grouped.items():
+        with ConditionalPiggybackSection(piggyback_name):
             for item in group:
                 with SectionWriter(item.section_name) as writer:
-                    writer.append(item.section.json())
+                    writer.append(item.section.model_dump_json())
 
 
 T_co = TypeVar("T_co", covariant=True, bound=IdentifiableSample)
@@ -86,10 +87,9 @@ class Selector(Generic[T_co]):
         self, metrics: Sequence[T_co], aggregator: Callable[[Sequence[T_co]], section.Section]
     ):
         self.aggregator = aggregator
-        self.metrics_map: dict[PodLookupName, list[T_co]] = {}
+        self.metrics_map: defaultdict[PodLookupName, list[T_co]] = defaultdict(list)
         for m in metrics:
-            key = m.pod_lookup_from_metric()
-            self.metrics_map.setdefault(key, []).append(m)
+            self.metrics_map[m.pod_lookup_from_metric()].append(m)
 
     def get_section(
         self, piggyback: Piggyback, section_name: SectionName
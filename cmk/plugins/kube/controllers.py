@@ -11,14 +11,14 @@ from kubernetes import client  # type: ignore[import-untyped]
 from cmk.plugins.kube.schemata import api
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompleteControlChain:
     # A sequence of controllers, e.g. deployment -> replica set. For two adjacent elements, the first
     # one controls the second one. The final element controls the pod.
     chain: Sequence[api.Controller]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncompleteControlChain:
     # Not all Owners could be determined based on the API data. This can have
     # several reasons. E.g., the controller is a CustomResourceDefinition; or
@@ -86,7 +86,7 @@ class ContainersStore(BaseModel):
     cpu: Sequence[CPUSample]
 
 
-@dataclass
+@dataclass(slots=True)
 class Samples:
     cpu: Sequence[CPUSample]
     memory: Sequence[MemorySample]
@@ -94,10 +94,13 @@ class Samples:
 
 _AllSamples = MemorySample | CPUSample | UnusedSample
 
+# Building a TypeAdapter analyzes the type and constructs the validator, which is
+# expensive. Do it once at import time, not per parsed payload.
+_SAMPLES_ADAPTER = TypeAdapter(list[_AllSamples])
+
 
 def parse_performance_metrics(cluster_collector_metrics: bytes) -> Sequence[_AllSamples]:
-    adapter = TypeAdapter(list[_AllSamples])
-    return adapter.validate_json(cluster_collector_metrics)
+    return _SAMPLES_ADAPTER.validate_json(cluster_collector_metrics)
 
 
 def create_selectors(
@@ -101,12 +101,15 @@ class ResponseError(ParseModel):
 
 Response = Annotated[ResponseSuccess | ResponseError, Field(discriminator="status")]
 
+# Building a TypeAdapter analyzes the type and constructs the validator, which
+# is expensive. Do it once at import time, not once per response.
+_RESPONSE_ADAPTER: TypeAdapter[Response] = TypeAdapter(Response)
+
 
 def parse_raw_response(
     response: bytes | str,
 ) -> Response | ValidationError | JSONDecodeError:
     try:
-        adapter: TypeAdapter[Response] = TypeAdapter(Response)
-        return adapter.validate_json(response)
+        return _RESPONSE_ADAPTER.validate_json(response)
     except (ValidationError, JSONDecodeError) as e:
         return e
@@ -182,12 +182,21 @@ def node_exporter_getter(
     return []
 
 
+# All API requests go to the same host, so a single urllib3 pool serves them. It must be
+# large enough that the thread pools querying the list and kubelet endpoints concurrently
+# do not discard connections (requests' default pool size is 10).
+_API_POOL_MAXSIZE = 32
+
+
 def make_api_client_requests(config: APISessionConfig, logger: logging.Logger) -> requests.Session:
     if not config.verify_cert_api:
         logger.warning("Disabling SSL certificate verification.")
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=_API_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.proxies.update(config.requests_proxies())
     session.headers.update({"Authorization": f"Bearer {config.token}"})
     session.headers.update({"Content-Type": "application/json"})
@@ -26,7 +26,7 @@ import enum
 import math
 import re
 from collections.abc import Mapping, Sequence
-from typing import Literal, NewType, TypeGuard
+from typing import Final, Literal, NewType, TypeGuard
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator, RootModel
 from pydantic.fields import Field
@@ -185,43 +185,51 @@ def parse_pod_number(value: str) -> int:
     return math.ceil(_parse_quantity(value))
 
 
+# Kubernetes uses a common field for any entry in resources, which it refers to as Quantity.
+# See staging/src/k8s.io/apimachinery/pkg/api/resource/quantity.go
+# All suffixes are either one or two characters long, so the parser can look them up directly
+# instead of checking them one by one. This function is called for every resource field of
+# every container and node.
+_QUANTITY_FACTORS: Final[Mapping[str, float]] = {
+    "Ki": 1024**1,
+    "Mi": 1024**2,
+    "Gi": 1024**3,
+    "Ti": 1024**4,
+    "Pi": 1024**5,
+    "Ei": 1024**6,
+    "K": 1e3,
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "E": 1e18,
+    "m": 1e-3,
+}
+
+
 def _parse_quantity(value: str) -> float:
-    # Kubernetes uses a common field for any entry in resources, which it refers to as Quantity.
-    # See staging/src/k8s.io/apimachinery/pkg/api/resource/quantity.go
-    for unit, factor in [
-        ("Ki", 1024**1),
-        ("Mi", 1024**2),
-        ("Gi", 1024**3),
-        ("Ti", 1024**4),
-        ("Pi", 1024**5),
-        ("Ei", 1024**6),
-        ("K", 1e3),
-        ("k", 1e3),
-        ("M", 1e6),
-        ("G", 1e9),
-        ("T", 1e12),
-        ("P", 1e15),
-        ("E", 1e18),
-        ("m", 1e-3),
-    ]:
-        if value.endswith(unit):
-            return factor * float(value.removesuffix(unit))
+    if (factor := _QUANTITY_FACTORS.get(value[-2:])) is not None:
+        return factor * float(value[:-2])
+    if (factor := _QUANTITY_FACTORS.get(value[-1:])) is not None:
+        return factor * float(value[:-1])
     return float(value)
 
 
 def convert_to_timestamp(kube_date_time: str | datetime.datetime) -> Timestamp:
     if isinstance(kube_date_time, str):
-        date_time = datetime.datetime.strptime(kube_date_time, "%Y-%m-%dT%H:%M:%SZ").replace(
-            tzinfo=datetime.UTC
-        )
+        # Kubernetes always reports RFC 3339 timestamps, for which fromisoformat is the
+        # C-implemented fast path. It is considerably faster than strptime, which matters
+        # since every object metadata carries a creation timestamp.
+        date_time = datetime.datetime.fromisoformat(kube_date_time)
     elif isinstance(kube_date_time, datetime.datetime):
         date_time = kube_date_time
-        if date_time.tzinfo is None:
-            raise ValueError(f"Can not convert to timestamp: '{kube_date_time}' is missing tzinfo")
     else:
         raise TypeError(
             f"Can not convert to timestamp: '{kube_date_time}' of type {type(kube_date_time)}"
         )
+    if date_time.tzinfo is None:
+        raise ValueError(f"Can not convert to timestamp: '{kube_date_time}' is missing tzinfo")
 
     return Timestamp(date_time.timestamp())
 
@@ -293,7 +293,7 @@ def setup_logging(verbosity: int) -> None:
     logging.basicConfig(level=lvl, format="%(asctime)s %(levelname)s %(message)s")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComposedEntities:
     # TODO: Currently, this class prepares APIData by packaging data from
     # different API queries. Some, but not all user configurations are taken
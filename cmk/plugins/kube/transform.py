@@ -9,7 +9,6 @@ data structures to version independent data structured defined in schemata.api
 
 from __future__ import annotations
 
-import typing
 from collections.abc import Iterable, Mapping, Sequence
 from typing import cast, Literal, TypeAlias, TypeVar
 
@@ -71,15 +70,14 @@ def expect_value(v: T | None) -> T:
     return v
 
 
+# Building a TypeAdapter analyzes the type and constructs the validator, which
+# is expensive. Do it once at import time, not once per pod.
+_VOLUMES_ADAPTER = pydantic.TypeAdapter(list[api.Volume])
+
+
 def pod_spec(pod: client.V1Pod) -> api.PodSpec:
     spec: client.V1PodSpec = expect_value(pod.spec)
 
-    def _parse_obj_as(
-        model: type[list[T]], expr: typing.Sequence[T] | None
-    ) -> typing.Sequence[T] | None:
-        adapter = pydantic.TypeAdapter(model)
-        return adapter.validate_python(expr)
-
     return api.PodSpec(
         node=spec.node_name,
         host_network=spec.host_network,
@@ -91,7 +89,7 @@ def pod_spec(pod: client.V1Pod) -> api.PodSpec:
         ),
         priority_class_name=spec.priority_class_name,
         active_deadline_seconds=spec.active_deadline_seconds,
-        volumes=_parse_obj_as(list[api.Volume], spec.volumes) if spec.volumes else None,
+        volumes=_VOLUMES_ADAPTER.validate_python(spec.volumes) if spec.volumes else None,
     )
 
 
@@ -61,17 +61,21 @@ def _parse_labels(raw_labels: str) -> Mapping[str, str]:
     return labels
 
 
+# csv.reader would have been a really neat solution; however, unfortunately
+# only double quotes, and not the separator characters themselves, inside
+# value strings like this:
+#     my_val="hello",another_val="you,my\"friend\""
+# are escaped, rendering it esentially unusable...
+# Compiled once, since _split_labels runs for every metric line of every kubelet dump.
+_LABEL_SEPARATOR_PATTERN = re.compile(r",(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)")
+
+
 def _split_labels(raw_labels: str) -> Iterator[str]:
     """Split comma separated Kubernetes labels text into individual labels"""
 
     if not raw_labels:
         return
 
-    # csv.reader would have been a really neat solution; however, unfortunately
-    # only double quotes, and not the separator characters themselves, inside
-    # value strings like this:
-    #     my_val="hello",another_val="you,my\"friend\""
-    # are escaped, rendering it esentially unusable...
-    for label in re.split(r",(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)", raw_labels):
+    for label in _LABEL_SEPARATOR_PATTERN.split(raw_labels):
         if label:
             yield label
@@ -64,14 +64,12 @@ class SectionManager:
 
     def flush(self) -> None:
         for d in self._data:
-            sys.stdout.write(str(d))
-            sys.stdout.write("\n")
+            sys.stdout.write(f"{d}\n")
         self._data.clear()
         sys.stdout.flush()
 
     def writeline(self, line: Any) -> None:
-        sys.stdout.write(str(line))
-        sys.stdout.write("\n")
+        sys.stdout.write(f"{line}\n")
 
 
 class ConditionalPiggybackSection(SectionManager):
@@ -11,7 +11,6 @@ have any friction during testing with these helpers themselves.
 
 from __future__ import annotations
 
-import collections
 import datetime as dt
 import io
 import itertools
@@ -290,7 +289,7 @@ program_start num_hosts num_services max_long_output_size core_pid edition'
 
     def __init__(self) -> None:
         self.sites: list[SiteName] = []
-        self._connections: dict[SiteName, MockSingleSiteConnection] = collections.OrderedDict()
+        self._connections: dict[SiteName, MockSingleSiteConnection] = {}
         self._expect_status_query: bool | None = None
         self.tables: Tables = {}
         self.set_sites(["NO_SITE", "remote", "local"])
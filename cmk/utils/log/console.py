@@ -4,6 +4,9 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import logging
+import os
+import sys
+from collections.abc import Callable, Iterable
 from typing import TextIO
 
 from ._level import VERBOSE as VERBOSE
@@ -11,34 +14,81 @@ from ._level import VERBOSE as VERBOSE
 # NOTE: We abuse the log level of this logger as a global variable!
 _console = logging.getLogger("cmk.base.console")
 
+# Static floor for console output, read once at import: emitters below this
+# level are replaced by no-ops, so a setup which guarantees e.g. debug output
+# is off does not even pay for the per-call level check. Unset or 0 keeps all
+# emitters live; the dynamic logger level still applies on top.
+_STATIC_LEVEL_FLOOR = int(os.environ.get("CMK_MAX_LOG_LEVEL") or 0)
 
-def error(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(logging.ERROR):
-        print(text, file=file, flush=True)
 
+def _make_emitter(level: int, end: str = "\n") -> Callable[..., None]:
+    if level < _STATIC_LEVEL_FLOOR:
 
-def warning(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(logging.WARNING):
-        print(text, file=file, flush=True)
+        def suppressed(text: str, *, file: TextIO | None = None) -> None:
+            pass
 
+        return suppressed
 
-def info(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(logging.INFO):
-        print(text, file=file, flush=True)
+    # The level check runs on every call, even (especially) for messages which
+    # are not emitted at all. Binding the check and the level into the closure
+    # avoids the global and attribute lookups per call; CPython caches the
+    # isEnabledFor result per level in the logger, so level changes on the
+    # logger hierarchy are still picked up.
+    enabled = _console.isEnabledFor
 
+    def emit(text: str, *, file: TextIO | None = None) -> None:
+        if enabled(level):
+            stream = sys.stdout if file is None else file
+            stream.write(f"{text}{end}")
+            stream.flush()
 
-# TODO: Figure out where this is used for a "real" console vs. some internal protocol.
-# The latter should really be disentangled from this file here.
-def verbose_no_lf(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(VERBOSE):
-        print(text, end="", file=file, flush=True)
+    return emit
 
 
-def verbose(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(VERBOSE):
-        print(text, file=file, flush=True)
+def _make_lazy_emitter(level: int) -> Callable[..., None]:
+    # For messages whose rendering is itself expensive: the callable is only
+    # invoked when the level is enabled, so hot loops can defer f-string or
+    # repr work without writing the isEnabledFor boilerplate themselves.
+    if level < _STATIC_LEVEL_FLOOR:
 
+        def suppressed(make_text: Callable[[], str], *, file: TextIO | None = None) -> None:
+            pass
 
-def debug(text: str, *, file: TextIO | None = None) -> None:
-    if _console.isEnabledFor(logging.DEBUG):
-        print(text, file=file, flush=True)
+        return suppressed
+
+    enabled = _console.isEnabledFor
+
+    def emit(make_text: Callable[[], str], *, file: TextIO | None = None) -> None:
+        if enabled(level):
+            stream = sys.stdout if file is None else file
+            stream.write(f"{make_text()}\n")
+            stream.flush()
+
+    return emit
+
+
+error = _make_emitter(logging.ERROR)
+warning = _make_emitter(logging.WARNING)
+info = _make_emitter(logging.INFO)
+# TODO: Figure out where verbose_no_lf is used for a "real" console vs. some internal
+# protocol. The latter should really be disentangled from this file here.
+verbose_no_lf = _make_emitter(VERBOSE, end="")
+verbose = _make_emitter(VERBOSE)
+debug = _make_emitter(logging.DEBUG)
+verbose_lazy = _make_lazy_emitter(VERBOSE)
+debug_lazy = _make_lazy_emitter(logging.DEBUG)
+
+
+def write_many(entries: Iterable[tuple[int, str]], *, file: TextIO | None = None) -> None:
+    """Write a batch of (level, text) lines with a single flush.
+
+    Call sites emitting many lines in a tight loop (progress reporters,
+    per-service output) should prefer this over one emitter call per line:
+    it issues one writelines() and one flush() for the whole batch.
+    """
+    enabled = _console.isEnabledFor
+    stream = sys.stdout if file is None else file
+    stream.writelines(
+        f"{text}\n" for level, text in entries if level >= _STATIC_LEVEL_FLOOR and enabled(level)
+    )
+    stream.flush()
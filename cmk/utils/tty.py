@@ -7,8 +7,10 @@ on ttys while being compatible when the command is not attached to a TTY"""
 
 import errno
 import fcntl
+import functools
 import io
 import itertools
+import re
 import struct
 import sys
 import termios
@@ -46,6 +48,22 @@ ok = ""
 warn = ""
 error = ""
 states: dict[int, str] = {}
+# The constant part of format_warning's output, assembled once per color
+# (re-)initialization instead of on every call.
+_warning_prefix = ""
+
+
+_INDENT_PATTERN = re.compile(r"\s*")
+
+
+# Warnings tend to repeat verbatim (polling loops, per-host messages), so cache
+# the formatted result. reinit() drops the cache when the color codes change.
+@functools.lru_cache(maxsize=256)
+def format_warning(text: str) -> str:
+    match = _INDENT_PATTERN.match(text)
+    assert match is not None  # r"\s*" matches any string, possibly empty
+    indent_end = match.end()
+    return f"{text[:indent_end]}{_warning_prefix}{text[indent_end:]}"
 
 
 def reinit() -> None:
@@ -92,6 +110,9 @@ def reinit() -> None:
     warn = yellow + bold + "WARNING" + normal
     error = red + bold + "ERROR" + normal
     states = {0: green, 1: yellow, 2: red, 3: magenta}
+    global _warning_prefix
+    _warning_prefix = f"{bold}{yellow}WARNING:{normal} "
+    format_warning.cache_clear()
 
 
 reinit()
@@ -162,9 +183,3 @@ def _row_template(lengths: list[int], colors: TableColors, indent: str) -> str:
         sep = " "
     fmt += "\n"
     return fmt
-
-
-def format_warning(text: str) -> str:
-    stripped = text.lstrip()
-    indent = text[: len(text) - len(stripped)]
-    return f"{indent}{bold}{yellow}WARNING:{normal} {stripped}"
@@ -6,7 +6,7 @@
 import logging
 import sys
 
-from pytest import CaptureFixture, LogCaptureFixture
+from pytest import CaptureFixture, LogCaptureFixture, MonkeyPatch
 
 from cmk.utils.log import console
 
@@ -68,3 +68,52 @@ def test_error(caplog: LogCaptureFixture, capsys: CaptureFixture[str]) -> None:
     caplog.set_level(console.VERBOSE, logger="cmk.base")
     console.error("hello", file=sys.stderr)
     assert ("", "hello\n") == capsys.readouterr()
+
+
+def test_debug_lazy_on(caplog: LogCaptureFixture, capsys: CaptureFixture[str]) -> None:
+    caplog.set_level(logging.DEBUG, logger="cmk.base")
+    console.debug_lazy(lambda: "hello")
+    assert ("hello\n", "") == capsys.readouterr()
+
+
+def test_debug_lazy_off(caplog: LogCaptureFixture, capsys: CaptureFixture[str]) -> None:
+    caplog.set_level(logging.DEBUG + 1, logger="cmk.base")
+
+    def fail() -> str:
+        raise AssertionError("must not be rendered")
+
+    console.debug_lazy(fail)
+    assert ("", "") == capsys.readouterr()
+
+
+def test_write_many_filters_levels(
+    caplog: LogCaptureFixture, capsys: CaptureFixture[str]
+) -> None:
+    caplog.set_level(logging.INFO, logger="cmk.base")
+    console.write_many(
+        [
+            (logging.DEBUG, "dropped"),
+            (logging.INFO, "hello"),
+            (logging.WARNING, "world"),
+        ]
+    )
+    assert ("hello\nworld\n", "") == capsys.readouterr()
+
+
+def test_write_many_explicit_stream(
+    caplog: LogCaptureFixture, capsys: CaptureFixture[str]
+) -> None:
+    caplog.set_level(logging.INFO, logger="cmk.base")
+    console.write_many([(logging.ERROR, "hello")], file=sys.stderr)
+    assert ("", "hello\n") == capsys.readouterr()
+
+
+def test_static_level_floor(
+    caplog: LogCaptureFixture, capsys: CaptureFixture[str], monkeypatch: MonkeyPatch
+) -> None:
+    caplog.set_level(logging.DEBUG, logger="cmk.base")
+    monkeypatch.setattr(console, "_STATIC_LEVEL_FLOOR", logging.INFO)
+    console._make_emitter(logging.DEBUG)("hello")
+    assert ("", "") == capsys.readouterr()
+    console._make_emitter(logging.INFO)("hello")
+    assert ("hello\n", "") == capsys.readouterr()